@@ -86,12 +86,23 @@ Shows GPS status and coordinates on SSD1306 OLED display
 # import serial
 import board
 import busio
+import sys
 from PIL import Image, ImageDraw, ImageFont
 import adafruit_ssd1306
 # from gpsParser import GPSReader
 
 
 
+# OLED status line per fix type. Interned once so the redraw check in
+# display_gps_data can compare by identity instead of by value.
+FIX_STATUS = {
+    "3D": sys.intern("3D Fix"),
+    "2D": sys.intern("2D Fix"),
+    None: sys.intern("GPS Fix"),
+}
+
+
+
 
 class GPSOLEDDisplay:
     """
@@ -118,6 +129,12 @@ class GPSOLEDDisplay:
         # Create blank image for drawing
         self.width = self.display.width
         self.height = self.display.height
+        self.pages = self.height // 8
+        
+        # Column/page addressing window for full-frame writes
+        self.window_cmds = bytes((0x00,
+                                  0x21, 0, self.width - 1,   # SET_COL_ADDR
+                                  0x22, 0, self.pages - 1))  # SET_PAGE_ADDR
         self.image = Image.new("1", (self.width, self.height))
         self.draw = ImageDraw.Draw(self.image)
         
@@ -146,8 +163,7 @@ class GPSOLEDDisplay:
         self.draw.text((20, 20), "GPS NODE", font=self.font_large, fill=255)
         self.draw.text((15, 40), "Initializing...", font=self.font_small, fill=255)
         
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
 
 
@@ -159,8 +175,7 @@ class GPSOLEDDisplay:
         self.draw.text((15, 25), "Waiting for", font=self.font_small, fill=255)
         self.draw.text((20, 40), "GPS Fix...", font=self.font_small, fill=255)
         
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
 
     # # OLD:
@@ -234,15 +249,12 @@ class GPSOLEDDisplay:
             return
             
         # Format the status text without satellite count
-        if gps_data.fix_type:
-            status_text = f"{gps_data.fix_type} Fix"
-        else:
-            status_text = "GPS Fix"
+        status_text = FIX_STATUS.get(gps_data.fix_type, FIX_STATUS[None])
             
         # Check if position has changed
         if (self.last_lat == gps_data.latitude and 
             self.last_lon == gps_data.longitude and
-            self.last_status == status_text):
+            self.last_status is status_text):
             return
             
         # Clear image
@@ -273,8 +285,7 @@ class GPSOLEDDisplay:
         self.draw.text((5, 49), lon_text, font=self.font_large, fill=255)
         
         # Update display
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
         # Update last displayed values
         self.last_lat = gps_data.latitude
@@ -283,6 +294,31 @@ class GPSOLEDDisplay:
         
 
 
+    def refresh(self):
+        """
+        Push the drawn image to the OLED
+
+        Packs self.image straight into the driver's page buffer instead of
+        going through display.image(), which sets all 8192 pixels one at a
+        time in Python. The SSD1306 stores each column of a page as one byte
+        with the top pixel in the LSB, so a transposed image packed LSB-first
+        ("1;R") yields those bytes column by column; every page is then one
+        strided slice into display.buf.
+        """
+        packed = self.image.transpose(Image.Transpose.TRANSPOSE).tobytes("raw", "1;R")
+        for page in range(self.pages):
+            start = page * self.width
+            self.display.buf[start:start + self.width] = packed[page::self.pages]
+
+        # display.show() sends each addressing command as its own 2-byte
+        # transfer. Send them as one command stream (control byte 0x00)
+        # followed by the framebuffer, under a single bus lock.
+        with self.display.i2c_device as i2c:
+            i2c.write(self.window_cmds)
+            i2c.write(self.display.buffer)
+
+
+
     def clear(self):
         """Clear the display"""
         self.display.fill(0)
@@ -329,8 +365,7 @@ def main():
         print(f"Error opening GPS serial port: {e}")
         oled.draw.rectangle((0, 0, oled.width, oled.height), outline=0, fill=0)
         oled.draw.text((10, 25), "GPS Error!", font=oled.font_large, fill=255)
-        oled.display.image(oled.image)
-        oled.display.show()
+        oled.refresh()
         return
     
     
@@ -6,7 +6,21 @@ Parses NMEA sentences and provides human-readable GPS data
 
 import time
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Tuple
+
+
+# Masks for folding a little-endian int of 2**k bytes down to 2**(k-1) bytes
+_FOLD_MASKS = tuple((1 << (8 << k)) - 1 for k in range(8))
+
+
+def _xor_bytes(data: bytes) -> int:
+    """XOR all bytes of data together (data must be at most 256 bytes)"""
+    x = int.from_bytes(data, 'little')
+    k = (len(data) - 1).bit_length()
+    while k:
+        k -= 1
+        x = (x >> (8 << k)) ^ (x & _FOLD_MASKS[k])
+    return x
 
 
 @dataclass
@@ -123,14 +137,38 @@ class MA_GPSReader:
     GPS Reader class for parsing NMEA sentences from SAM-M8Q module
     """
     
-    def __init__(self, serial_port):
+    # Sentence type -> (parser method, GPSData attribute for the raw sentence)
+    _DISPATCH = {
+        '$GPRMC': ('parse_rmc', 'last_rmc'),
+        '$GNRMC': ('parse_rmc', 'last_rmc'),
+        '$GPGGA': ('parse_gga', 'last_gga'),
+        '$GNGGA': ('parse_gga', 'last_gga'),
+        '$GPGSA': ('parse_gsa', 'last_gsa'),
+        '$GNGSA': ('parse_gsa', 'last_gsa'),
+        '$GPGSV': ('parse_gsv', 'last_gsv'),
+        '$GLGSV': ('parse_gsv', 'last_gsv'),
+        '$GNGSV': ('parse_gsv', 'last_gsv'),
+        '$GPGLL': ('parse_gll', 'last_gll'),
+        '$GNGLL': ('parse_gll', 'last_gll'),
+    }
+    
+    def __init__(self, serial_port, *, validate_checksum: bool = True,
+                 sentences: Optional[Iterable[str]] = None):
         """
         Initialize GPS Reader
         
         Args:
             serial_port: Serial port object for GPS communication
+            validate_checksum: Drop sentences whose checksum doesn't match.
+                Can be turned off for a short, trusted UART link
+            sentences: Sentence types to parse, e.g. {'RMC', 'GGA'}; all
+                others are skipped as soon as their type is read.
+                Defaults to every supported type
         """
         self.serial = serial_port
+        self.validate_checksum = validate_checksum
+        self._dispatch = (self._DISPATCH if sentences is None else
+                          {k: v for k, v in self._DISPATCH.items() if k[3:] in sentences})
         self.gps_data = GPSData()
         self.sentence_buffer = ""
         self.gsv_messages = {}  # Store multi-part GSV messages
@@ -179,57 +217,47 @@ class MA_GPSReader:
         Args:
             sentence: Complete NMEA sentence starting with $
         """
-        if not self._verify_checksum(sentence):
+        star = sentence.find('*')
+        
+        # Resolve the sentence type first so unregistered sentences
+        # are dropped before paying for the checksum
+        body = sentence[:star] if star >= 0 else sentence
+        parts = body.split(',')
+        entry = self._dispatch.get(parts[0])
+        if entry is None:
+            return
+        
+        if self.validate_checksum and not self._verify_checksum(sentence, star):
             return
-            
-        # Remove checksum for parsing
-        if '*' in sentence:
-            sentence = sentence.split('*')[0]
-            
-        parts = sentence.split(',')
-        sentence_type = parts[0]
         
         try:
-            if sentence_type in ['$GPRMC', '$GNRMC']:
-                self.parse_rmc(parts)
-                self.gps_data.last_rmc = sentence
-            elif sentence_type in ['$GPGGA', '$GNGGA']:
-                self.parse_gga(parts)
-                self.gps_data.last_gga = sentence
-            elif sentence_type in ['$GPGSA', '$GNGSA']:
-                self.parse_gsa(parts)
-                self.gps_data.last_gsa = sentence
-            elif sentence_type in ['$GPGSV', '$GLGSV', '$GNGSV']:
-                self.parse_gsv(parts)
-                self.gps_data.last_gsv = sentence
-            elif sentence_type in ['$GPGLL', '$GNGLL']:
-                self.parse_gll(parts)
-                self.gps_data.last_gll = sentence
+            parser, raw_attr = entry
+            getattr(self, parser)(parts)
+            setattr(self.gps_data, raw_attr, body)
         except Exception:
             # Skip malformed sentences
             pass
     
 
 
-    def _verify_checksum(self, sentence: str) -> bool:
+    def _verify_checksum(self, sentence: str, star: int) -> bool:
         """
         Verify NMEA sentence checksum
         
         Args:
             sentence: NMEA sentence with checksum
+            star: Index of the '*' in sentence, or -1 if there is none
             
         Returns:
             True if checksum is valid
         """
-        if '*' not in sentence:
+        if star < 0:
             return False
             
         try:
-            data, checksum = sentence[1:].split('*')
-            calculated = 0
-            for char in data:
-                calculated ^= ord(char)
-            return int(checksum, 16) == calculated
+            # XOR the payload bytes as one big int fold instead of per byte
+            calculated = _xor_bytes(sentence[1:star].encode('ascii'))
+            return int(sentence[star + 1:star + 3], 16) == calculated
         except:
             return False
     
@@ -544,7 +572,7 @@ class MA_GPSReader:
             decimal = degrees + (minutes / 60.0)
             
             # Apply direction
-            if direction in ['S', 'W']:
+            if direction == 'S' or direction == 'W':
                 decimal = -decimal
                 
             return decimal
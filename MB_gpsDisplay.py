@@ -76,11 +76,22 @@ import time
 import serial
 import board
 import busio
+import sys
 from PIL import Image, ImageDraw, ImageFont
 import adafruit_ssd1306
 from gpsParser import GPSReader
 
 
+
+# OLED status line per fix type. Interned once so the redraw check in
+# display_gps_data can compare by identity instead of by value.
+FIX_STATUS = {
+    "3D": sys.intern("3D Fix"),
+    "2D": sys.intern("2D Fix"),
+    None: sys.intern("GPS Fix"),
+}
+
+
 class GPSOLEDDisplay:
     """
     Handles displaying GPS data on SSD1306 OLED
@@ -106,6 +117,12 @@ class GPSOLEDDisplay:
         # Create blank image for drawing
         self.width = self.display.width
         self.height = self.display.height
+        self.pages = self.height // 8
+        
+        # Column/page addressing window for full-frame writes
+        self.window_cmds = bytes((0x00,
+                                  0x21, 0, self.width - 1,   # SET_COL_ADDR
+                                  0x22, 0, self.pages - 1))  # SET_PAGE_ADDR
         self.image = Image.new("1", (self.width, self.height))
         self.draw = ImageDraw.Draw(self.image)
         
@@ -132,8 +149,7 @@ class GPSOLEDDisplay:
         self.draw.text((30, 20), "GPS NODE", font=self.font_large, fill=255)
         self.draw.text((25, 40), "Initializing...", font=self.font_small, fill=255)
         
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
 
 
@@ -145,8 +161,7 @@ class GPSOLEDDisplay:
         self.draw.text((25, 25), "Waiting for", font=self.font_small, fill=255)
         self.draw.text((30, 40), "GPS Fix...", font=self.font_small, fill=255)
         
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
 
 
@@ -167,15 +182,12 @@ class GPSOLEDDisplay:
         lon_rounded = round(gps_data.longitude, 2)
         
         # Determine fix type string (simplified)
-        if gps_data.fix_type:
-            status_text = f"{gps_data.fix_type} Fix"
-        else:
-            status_text = "GPS Fix"
+        status_text = FIX_STATUS.get(gps_data.fix_type, FIX_STATUS[None])
             
         # Check if position has changed (using rounded values)
         if (self.last_lat == lat_rounded and 
             self.last_lon == lon_rounded and
-            self.last_status == status_text):
+            self.last_status is status_text):
             return
             
         # Clear image
@@ -214,14 +226,36 @@ class GPSOLEDDisplay:
         self.draw.text((x_pos, 48), lon_text, font=self.font_large, fill=255)
         
         # Update display
-        self.display.image(self.image)
-        self.display.show()
+        self.refresh()
         
         # Update last displayed values
         self.last_lat = lat_rounded
         self.last_lon = lon_rounded
         self.last_status = status_text
         
+    def refresh(self):
+        """
+        Push the drawn image to the OLED
+
+        Packs self.image straight into the driver's page buffer instead of
+        going through display.image(), which sets all 8192 pixels one at a
+        time in Python. The SSD1306 stores each column of a page as one byte
+        with the top pixel in the LSB, so a transposed image packed LSB-first
+        ("1;R") yields those bytes column by column; every page is then one
+        strided slice into display.buf.
+        """
+        packed = self.image.transpose(Image.Transpose.TRANSPOSE).tobytes("raw", "1;R")
+        for page in range(self.pages):
+            start = page * self.width
+            self.display.buf[start:start + self.width] = packed[page::self.pages]
+
+        # display.show() sends each addressing command as its own 2-byte
+        # transfer. Send them as one command stream (control byte 0x00)
+        # followed by the framebuffer, under a single bus lock.
+        with self.display.i2c_device as i2c:
+            i2c.write(self.window_cmds)
+            i2c.write(self.display.buffer)
+
     def clear(self):
         """Clear the display"""
         self.display.fill(0)
@@ -247,8 +281,7 @@ def main():
         print(f"Error opening GPS serial port: {e}")
         oled.draw.rectangle((0, 0, oled.width, oled.height), outline=0, fill=0)
         oled.draw.text((20, 25), "GPS Error!", font=oled.font_large, fill=255)
-        oled.display.image(oled.image)
-        oled.display.show()
+        oled.refresh()
         return
         
     # Show waiting message
@@ -4,13 +4,49 @@ GPS Parser Module for SAM-M8Q GPS Module
 Parses NMEA sentences and provides human-readable GPS data
 """
 
+import copy
+import threading
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
-from datetime import datetime, timezone, timedelta
+from typing import Iterable, Optional, List, Tuple
 
 
-@dataclass
+_INV60 = 1.0 / 60.0  # minutes -> degrees
+
+# GSA mode2 field -> fix type, indexed by the digit ('1'..'3')
+_FIX_TYPES = ('Unknown', 'No Fix', '2D', '3D')
+
+# GSV satellite table: one row of (prn, elevation, azimuth, snr) per satellite
+MAX_SATELLITES = 32
+SAT_FIELDS = 4
+
+
+# Masks for folding a little-endian int of 2**k bytes down to 2**(k-1) bytes
+_FOLD_MASKS = tuple((1 << (8 << k)) - 1 for k in range(8))
+
+
+def _xor_bytes(data: bytes) -> int:
+    """XOR all bytes of data together (data must be at most 256 bytes)"""
+    x = int.from_bytes(data, 'little')
+    k = (len(data) - 1).bit_length()
+    while k:
+        k -= 1
+        x = (x >> (8 << k)) ^ (x & _FOLD_MASKS[k])
+    return x
+
+
+def _maybe_float(s: str) -> Optional[float]:
+    """Convert an NMEA field to float, or None if the field is empty"""
+    return float(s) if s else None
+
+
+def _maybe_int(s: str) -> Optional[int]:
+    """Convert an NMEA field to int, or None if the field is empty"""
+    return int(s) if s else None
+
+
+@dataclass(slots=True)
 class GPSData:
     """
     Dataclass to store parsed GPS information
@@ -31,7 +67,11 @@ class GPSData:
     fix_type: Optional[str] = None  # "No Fix", "2D", "3D"
     satellites_used: Optional[int] = None
     satellites_in_view: Optional[int] = None
-    satellite_info: List[dict] = field(default_factory=list)  # From GSV
+    # From GSV: flat int16 table of SAT_FIELDS-wide rows, -1 for empty fields.
+    # Only the first satellite_count rows are current (see get_satellite_info).
+    satellite_info: array = field(
+        default_factory=lambda: array('h', [-1] * (MAX_SATELLITES * SAT_FIELDS)))
+    satellite_count: int = 0
     
     # Accuracy data
     hdop: Optional[float] = None  # Horizontal dilution of precision
@@ -47,14 +87,15 @@ class GPSData:
     mode: Optional[str] = None  # A=Autonomous, D=Differential, N=Not valid
     status: Optional[str] = None  # A=Active, V=Void
     
-    # Raw NMEA sentences for debugging
+    # Raw NMEA sentences for debugging (only filled when MB_GPSReader.debug is set)
     last_rmc: Optional[str] = None
     last_gga: Optional[str] = None
     last_gsa: Optional[str] = None
     last_gsv: Optional[str] = None
     last_gll: Optional[str] = None
     
-    # Update tracking
+    # Update tracking (last_update: time of the burst that last set the
+    # position from RMC/GGA/GLL; other sentences leave it alone)
     last_update: Optional[float] = field(default_factory=time.time)
     last_valid_lat: Optional[float] = None
     last_valid_lon: Optional[float] = None
@@ -67,6 +108,16 @@ class GPSData:
             return f"{abs(self.latitude):.6f}°{lat_dir}, {abs(self.longitude):.6f}°{lon_dir}"
         return "No Position"
     
+    def copy(self) -> 'GPSData':
+        """Return an independent copy (the satellite table is copied too)"""
+        snap = copy.copy(self)
+        snap.satellite_info = array('h', self.satellite_info)
+        return snap
+    
+    def get_satellite_info(self) -> memoryview:
+        """Return a flat view of the current GSV rows (prn, elevation, azimuth, snr per satellite)"""
+        return memoryview(self.satellite_info)[:self.satellite_count * SAT_FIELDS]
+    
     def get_time_string(self) -> str:
         """Return formatted time string with local time"""
         if self.local_time and self.date:
@@ -108,24 +159,92 @@ class MB_GPSReader:
     GPS Reader class for parsing NMEA sentences from SAM-M8Q module
     """
     
-    def __init__(self, serial_port):
+    # Sentence type -> (parser method, GPSData attribute for the raw sentence)
+    _DISPATCH = {
+        '$GPRMC': ('parse_rmc', 'last_rmc'),
+        '$GNRMC': ('parse_rmc', 'last_rmc'),
+        '$GPGGA': ('parse_gga', 'last_gga'),
+        '$GNGGA': ('parse_gga', 'last_gga'),
+        '$GPGSA': ('parse_gsa', 'last_gsa'),
+        '$GNGSA': ('parse_gsa', 'last_gsa'),
+        '$GPGSV': ('parse_gsv', 'last_gsv'),
+        '$GNGSV': ('parse_gsv', 'last_gsv'),
+        '$GPGLL': ('parse_gll', 'last_gll'),
+        '$GNGLL': ('parse_gll', 'last_gll'),
+    }
+    
+    def __init__(self, serial_port, background: bool = False, *,
+                 validate_checksum: bool = True,
+                 sentences: Optional[Iterable[str]] = None):
         """
         Initialize GPS Reader
         
         Args:
             serial_port: Serial port object for GPS communication
+            background: Start a daemon thread that keeps reading the port;
+                use snapshot() instead of read_and_parse() to get the data
+            validate_checksum: Drop sentences whose checksum doesn't match.
+                Can be turned off for a short, trusted UART link
+            sentences: Sentence types to parse, e.g. {'RMC', 'GGA'}; all
+                others are skipped as soon as their type is read.
+                Defaults to every supported type
         """
         self.serial = serial_port
+        self.validate_checksum = validate_checksum
+        self._dispatch = (self._DISPATCH if sentences is None else
+                          {k: v for k, v in self._DISPATCH.items() if k[3:] in sentences})
         self.gps_data = GPSData()
-        self.sentence_buffer = ""
+        self._position_updated = False  # set by parsers that store a position
+        self.sentence_buffer = bytearray()
         self.gsv_buffer = {}  # Buffer for multi-part GSV messages
         
         # US Central Time offset (adjust for DST as needed)
         # CST = UTC-6, CDT = UTC-5
         self.utc_offset_hours = -6  # Change to -5 for daylight saving time
         
-        
-        
+        # Drain the port with one bulk read per pass: read() blocks in the
+        # driver until read_size bytes or the serial timeout, so there is no
+        # in_waiting polling. Each read's timeout is trimmed to the caller's
+        # deadline (see _read_once).
+        self.read_size = 4096  # bytes, several seconds of NMEA at 9600 baud
+        if self.serial is not None and not self.serial.timeout:
+            self.serial.timeout = 0.1  # keep a timeout the caller already set
+        self._port_timeout = self.serial.timeout if self.serial is not None else None
+        
+        # Cap on a buffered partial sentence. NMEA sentences are at most
+        # 82 characters, so anything longer is line noise or a stalled
+        # stream and is dropped rather than re-split on every read.
+        self.max_buffer_size = 8192
+        self.buffer_overflows = 0
+        
+        # Keep the raw last_rmc/last_gga/... sentences only when debugging
+        self.debug = False
+        
+        # Background reader: the latest complete GPSData is published by
+        # swapping a single reference, so snapshot() never takes a lock
+        self._snapshot = self.gps_data.copy()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.last_error: Optional[Exception] = None  # background port failure
+        if background:
+            self.start()
+        
+        
+        
+    @property
+    def utc_offset_hours(self) -> int:
+        """Offset from UTC used for local_time, in whole hours"""
+        return self._utc_offset_hours
+    
+    @utc_offset_hours.setter
+    def utc_offset_hours(self, hours: int) -> None:
+        self._utc_offset_hours = hours
+        # UTC hour -> zero-padded local hour, wrapped around midnight
+        self._local_hours = tuple(f"{(h + hours) % 24:02d}" for h in range(24))
+        # Forget any memoized local time computed with the old offset
+        self._last_time_raw = None
+        self._last_time_parsed = (None, None)
+    
     def read_and_parse(self, timeout: float = 1.0) -> GPSData:
         """
         Read data from GPS and parse NMEA sentences
@@ -136,89 +255,163 @@ class MB_GPSReader:
         Returns:
             Updated GPSData object
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        while (time.time() - start_time) < timeout:
-            if self.serial.in_waiting:
-                try:
-                    # Read available data
-                    data = self.serial.read(self.serial.in_waiting)
-                    self.sentence_buffer += data.decode('ascii', errors='ignore')
-                    
-                    # Process complete sentences
-                    while '\n' in self.sentence_buffer:
-                        line, self.sentence_buffer = self.sentence_buffer.split('\n', 1)
-                        line = line.strip()
-                        
-                        if line.startswith('$'):
-                            self._parse_nmea_sentence(line)
-                            
-                except Exception as e:
-                    # Continue on decode errors
-                    pass
-            else:
-                time.sleep(0.01)  # Small delay to prevent CPU spinning
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._read_once(remaining)
                 
         return self.gps_data
     
+    def start(self) -> None:
+        """Start the background reader thread (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
     
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the background reader thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
     
-    def _parse_nmea_sentence(self, sentence: str) -> None:
+    def snapshot(self) -> GPSData:
+        """
+        Return the latest GPS data published by the background reader
+        
+        The returned object is never modified afterwards, so callers can
+        read it without locking. Each new burst replaces it with a fresh copy.
+        If the port fails, the snapshot goes stale and last_error holds the
+        exception until a read succeeds again.
+        """
+        return self._snapshot
+    
+    def _run(self) -> None:
+        """Background thread body: drain the port and publish snapshots"""
+        while not self._stop_event.is_set():
+            try:
+                # Short waits keep stop() responsive
+                parsed = self._read_once(0.1)
+            except OSError as e:  # includes serial.SerialException
+                # Port unplugged or closed: report it and back off
+                # instead of spinning on the failing read
+                self.last_error = e
+                self._stop_event.wait(0.5)
+                continue
+            self.last_error = None
+            if parsed:
+                self._snapshot = self.gps_data.copy()
+    
+    def _read_once(self, max_wait: float) -> bool:
+        """
+        Do one bulk serial read and parse every complete sentence in it
+        
+        Serial errors are not caught here; they propagate to the caller.
+        
+        Args:
+            max_wait: Longest time to wait for data if none is buffered
+            
+        Returns:
+            True if at least one sentence was parsed
+        """
+        # Bound the blocking read by max_wait as well as the port timeout,
+        # so it never runs past the caller's deadline (pyserial only
+        # reconfigures the port when the value actually changes)
+        wait = min(self._port_timeout, max_wait)
+        if self.serial.timeout != wait:
+            self.serial.timeout = wait
+        data = self.serial.read(self.read_size)
+        if not data:
+            return False
+        self.sentence_buffer.extend(data)
+        now = time.time()
+        
+        # Split out all complete sentences at once; the last
+        # piece is a partial sentence and stays buffered
+        lines = self.sentence_buffer.split(b'\n')
+        self.sentence_buffer = bytearray(lines[-1])
+        if len(self.sentence_buffer) > self.max_buffer_size:
+            self.sentence_buffer.clear()
+            self.buffer_overflows += 1
+        
+        parsed_any = False
+        for raw in lines[:-1]:
+            # Check for '$' on the raw bytes so blank lines and noise
+            # are dropped without being decoded
+            raw = raw.strip()
+            if raw.startswith(b'$'):
+                try:
+                    line = raw.decode('ascii', errors='ignore')
+                    parsed_any |= self._parse_nmea_sentence(line)
+                except ValueError:
+                    # Continue on decode/parse errors
+                    continue
+                
+        # One timestamp for the whole burst, and only if it stored a
+        # position: GSV/GSA or a no-fix RMC don't make a fix fresh
+        if self._position_updated:
+            self.gps_data.last_update = now
+            self._position_updated = False
+        return parsed_any
+    
+    
+    
+    def _parse_nmea_sentence(self, sentence: str) -> bool:
         """
         Parse a complete NMEA sentence
         
         Args:
             sentence: Complete NMEA sentence starting with $
-        """
-        if not self._verify_checksum(sentence):
-            return
-            
-        # Remove checksum for parsing
-        if '*' in sentence:
-            sentence = sentence.split('*')[0]
             
-        parts = sentence.split(',')
-        sentence_type = parts[0]
+        Returns:
+            True if the sentence was recognized and parsed
+        """
+        star = sentence.rfind('*')
+        
+        # Resolve the sentence type first so unregistered sentences
+        # are dropped before paying for the checksum
+        body = sentence[:star] if star >= 0 else sentence
+        parts = body.split(',')
+        entry = self._dispatch.get(parts[0])
+        if entry is None:
+            return False
+        
+        if self.validate_checksum and not self._verify_checksum(sentence, star):
+            return False
         
         try:
-            if sentence_type in ['$GPRMC', '$GNRMC']:
-                self.parse_rmc(parts)
-                self.gps_data.last_rmc = sentence
-            elif sentence_type in ['$GPGGA', '$GNGGA']:
-                self.parse_gga(parts)
-                self.gps_data.last_gga = sentence
-            elif sentence_type in ['$GPGSA', '$GNGSA']:
-                self.parse_gsa(parts)
-                self.gps_data.last_gsa = sentence
-            elif sentence_type in ['$GPGSV', '$GNGSV']:
-                self.parse_gsv(parts)
-                self.gps_data.last_gsv = sentence
-            elif sentence_type in ['$GPGLL', '$GNGLL']:
-                self.parse_gll(parts)
-                self.gps_data.last_gll = sentence
+            parser, raw_attr = entry
+            getattr(self, parser)(parts)
+            if self.debug:
+                setattr(self.gps_data, raw_attr, body)
         except Exception:
             # Skip malformed sentences
-            pass
+            return False
+        return True
     
-    def _verify_checksum(self, sentence: str) -> bool:
+    def _verify_checksum(self, sentence: str, star: int) -> bool:
         """
         Verify NMEA sentence checksum
         
         Args:
             sentence: NMEA sentence with checksum
+            star: Index of the '*' in sentence, or -1 if there is none
             
         Returns:
             True if checksum is valid
         """
-        if '*' not in sentence:
+        if star < 0:
             return False
             
         try:
-            data, checksum = sentence[1:].split('*')
-            calculated = 0
-            for char in data:
-                calculated ^= ord(char)
-            return int(checksum, 16) == calculated
+            # XOR every byte between '$' and '*' by folding them as one int
+            calculated = _xor_bytes(sentence[1:star].encode('ascii'))
+            return int(sentence[star + 1:star + 3], 16) == calculated
         except:
             return False
     
@@ -233,19 +426,19 @@ class MB_GPSReader:
             
         # Time
         if parts[1]:
-            self.gps_data.utc_time = self._parse_time(parts[1])
-            self.gps_data.local_time = self._convert_to_local_time(parts[1])
+            self._set_time(parts[1])
             
         # Status
         self.gps_data.status = parts[2] if parts[2] else None
         
         # Position
         if parts[3] and parts[4] and parts[5] and parts[6]:
-            lat = self._parse_coordinate(parts[3], parts[4])
-            lon = self._parse_coordinate(parts[5], parts[6])
+            lat = self._parse_coordinate(parts[3], parts[4], 2)
+            lon = self._parse_coordinate(parts[5], parts[6], 3)
             if lat is not None and lon is not None and lat != 0.0 and lon != 0.0:
                 self.gps_data.latitude = lat
                 self.gps_data.longitude = lon
+                self._position_updated = True
             
         # Speed
         if parts[7]:
@@ -269,9 +462,6 @@ class MB_GPSReader:
         # Mode (if available)
         if len(parts) > 12 and parts[12]:
             self.gps_data.mode = parts[12]
-            
-        # Update timestamp
-        self.gps_data.last_update = time.time()
     
     def parse_gga(self, parts: List[str]) -> None:
         """
@@ -282,49 +472,33 @@ class MB_GPSReader:
         if len(parts) < 14:
             return
             
+        # Convert the numeric fields before touching gps_data, so a
+        # malformed one drops the whole sentence instead of half of it
+        fix_quality = _maybe_int(parts[6])
+        satellites_used = _maybe_int(parts[7])
+        hdop = _maybe_float(parts[8])
+        altitude = _maybe_float(parts[9])
+        
         # Time
         if parts[1]:
-            self.gps_data.utc_time = self._parse_time(parts[1])
-            self.gps_data.local_time = self._convert_to_local_time(parts[1])
+            self._set_time(parts[1])
             
         # Position
         if parts[2] and parts[3] and parts[4] and parts[5]:
-            lat = self._parse_coordinate(parts[2], parts[3])
-            lon = self._parse_coordinate(parts[4], parts[5])
+            lat = self._parse_coordinate(parts[2], parts[3], 2)
+            lon = self._parse_coordinate(parts[4], parts[5], 3)
             if lat is not None and lon is not None and lat != 0.0 and lon != 0.0:
                 self.gps_data.latitude = lat
                 self.gps_data.longitude = lon
+                self._position_updated = True
             
-        # Fix quality
-        if parts[6]:
-            try:
-                self.gps_data.fix_quality = int(parts[6])
-            except ValueError:
-                pass
-                
-        # Satellites used
-        if parts[7]:
-            try:
-                self.gps_data.satellites_used = int(parts[7])
-            except ValueError:
-                pass
-                
-        # HDOP
-        if parts[8]:
-            try:
-                self.gps_data.hdop = float(parts[8])
-            except ValueError:
-                pass
-                
-        # Altitude
-        if parts[9]:
-            try:
-                self.gps_data.altitude = float(parts[9])
-            except ValueError:
-                pass
-                
-        # Update timestamp
-        self.gps_data.last_update = time.time()
+        # Fix quality, satellites used and altitude (an empty field clears
+        # the value). An empty HDOP keeps the one GSA may have supplied.
+        self.gps_data.fix_quality = fix_quality
+        self.gps_data.satellites_used = satellites_used
+        if hdop is not None:
+            self.gps_data.hdop = hdop
+        self.gps_data.altitude = altitude
     
     def parse_gsa(self, parts: List[str]) -> None:
         """
@@ -335,32 +509,23 @@ class MB_GPSReader:
         if len(parts) < 18:
             return
             
+        # Convert the DOP fields first, so a malformed one drops the
+        # whole sentence before gps_data is touched
+        pdop = _maybe_float(parts[15])
+        hdop = _maybe_float(parts[16])
+        vdop = _maybe_float(parts[17])
+        
         # Fix type
-        if parts[2]:
-            fix_types = {'1': 'No Fix', '2': '2D', '3': '3D'}
-            self.gps_data.fix_type = fix_types.get(parts[2], 'Unknown')
+        mode = parts[2]
+        if mode:
+            self.gps_data.fix_type = (
+                _FIX_TYPES[int(mode)] if mode in ('1', '2', '3') else 'Unknown')
             
-        # DOP values
-        if parts[15]:  # PDOP
-            try:
-                self.gps_data.pdop = float(parts[15])
-            except ValueError:
-                pass
-                
-        if parts[16]:  # HDOP
-            try:
-                self.gps_data.hdop = float(parts[16])
-            except ValueError:
-                pass
-                
-        if parts[17]:  # VDOP
-            try:
-                self.gps_data.vdop = float(parts[17])
-            except ValueError:
-                pass
-                
-        # Update timestamp
-        self.gps_data.last_update = time.time()
+        # DOP values. An empty HDOP keeps the one GGA may have supplied.
+        self.gps_data.pdop = pdop
+        if hdop is not None:
+            self.gps_data.hdop = hdop
+        self.gps_data.vdop = vdop
     
     def parse_gsv(self, parts: List[str]) -> None:
         """
@@ -381,17 +546,22 @@ class MB_GPSReader:
             
             # Parse satellite information (up to 4 satellites per message)
             if msg_num == 1:
-                self.gps_data.satellite_info = []
+                self.gps_data.satellite_count = 0
                 
-            for i in range(4, min(len(parts) - 1, 20), 4):
-                if parts[i]:  # Satellite number exists
-                    sat_info = {
-                        'prn': int(parts[i]) if parts[i] else None,
-                        'elevation': int(parts[i+1]) if i+1 < len(parts) and parts[i+1] else None,
-                        'azimuth': int(parts[i+2]) if i+2 < len(parts) and parts[i+2] else None,
-                        'snr': int(parts[i+3]) if i+3 < len(parts) and parts[i+3] else None
-                    }
-                    self.gps_data.satellite_info.append(sat_info)
+            sats = self.gps_data.satellite_info
+            for i in range(4, min(len(parts) - 1, 20), SAT_FIELDS):
+                group = parts[i:i + SAT_FIELDS]
+                count = self.gps_data.satellite_count
+                if group[0] and count < MAX_SATELLITES:  # Satellite number exists
+                    if len(group) < SAT_FIELDS:  # truncated last group
+                        group += [''] * (SAT_FIELDS - len(group))
+                    prn, elev, azim, snr = group
+                    row = count * SAT_FIELDS
+                    sats[row] = int(prn)
+                    sats[row + 1] = int(elev) if elev else -1
+                    sats[row + 2] = int(azim) if azim else -1
+                    sats[row + 3] = int(snr) if snr else -1
+                    self.gps_data.satellite_count = count + 1
         except (ValueError, IndexError):
             pass
     
@@ -407,8 +577,8 @@ class MB_GPSReader:
             
         # Position (use as fallback if main position data is invalid)
         if parts[1] and parts[2] and parts[3] and parts[4]:
-            lat = self._parse_coordinate(parts[1], parts[2])
-            lon = self._parse_coordinate(parts[3], parts[4])
+            lat = self._parse_coordinate(parts[1], parts[2], 2)
+            lon = self._parse_coordinate(parts[3], parts[4], 3)
             
             # Only use GLL data if we don't have valid position from RMC/GGA
             if (lat is not None and lon is not None and 
@@ -416,11 +586,11 @@ class MB_GPSReader:
                 (self.gps_data.latitude is None or self.gps_data.latitude == 0.0)):
                 self.gps_data.latitude = lat
                 self.gps_data.longitude = lon
+                self._position_updated = True
                 
         # Time
         if parts[5] and not self.gps_data.utc_time:
-            self.gps_data.utc_time = self._parse_time(parts[5])
-            self.gps_data.local_time = self._convert_to_local_time(parts[5])
+            self._set_time(parts[5])
             
         # Status
         if parts[6] and not self.gps_data.status:
@@ -430,6 +600,19 @@ class MB_GPSReader:
         if len(parts) > 7 and parts[7] and not self.gps_data.mode:
             self.gps_data.mode = parts[7]
     
+    def _set_time(self, time_str: str) -> None:
+        """
+        Store utc_time/local_time from an NMEA time field
+        
+        RMC, GGA and GLL in one burst carry the same time field, so the
+        result for the last raw value is reused instead of re-parsed.
+        """
+        if time_str != self._last_time_raw:
+            self._last_time_parsed = (self._parse_time(time_str),
+                                      self._convert_to_local_time(time_str))
+            self._last_time_raw = time_str
+        self.gps_data.utc_time, self.gps_data.local_time = self._last_time_parsed
+    
     def _convert_to_local_time(self, time_str: str) -> Optional[str]:
         """
         Convert UTC time to US Central Time
@@ -442,47 +625,36 @@ class MB_GPSReader:
         """
         try:
             if len(time_str) >= 6:
-                hours = int(time_str[0:2])
-                minutes = int(time_str[2:4])
-                seconds = int(time_str[4:6])
-                
-                # Create a datetime object for today with UTC time
-                utc_time = datetime.now(timezone.utc).replace(
-                    hour=hours, minute=minutes, second=seconds, microsecond=0
-                )
-                
-                # Convert to Central Time
-                local_time = utc_time + timedelta(hours=self.utc_offset_hours)
+                # Only the hour shifts; look up the precomputed local hour
+                hours = self._local_hours[int(time_str[0:2])]
+                minutes = time_str[2:4]
+                seconds = time_str[4:6]
                 
-                return local_time.strftime("%H:%M:%S")
+                return f"{hours}:{minutes}:{seconds}"
         except:
             pass
         return None
     
-    def _parse_coordinate(self, coord: str, direction: str) -> Optional[float]:
+    def _parse_coordinate(self, coord: str, direction: str, deg_digits: int) -> Optional[float]:
         """
         Parse NMEA coordinate to decimal degrees
         
         Args:
             coord: Coordinate string (DDMM.MMMM or DDDMM.MMMM)
             direction: N/S for latitude, E/W for longitude
+            deg_digits: Number of degree digits (2 for latitude, 3 for longitude)
             
         Returns:
             Decimal degrees (negative for S/W)
         """
         try:
-            # Determine if latitude (2 digits) or longitude (3 digits) for degrees
-            if len(coord.split('.')[0]) == 4:  # Latitude DDMM.MMMM
-                degrees = float(coord[:2])
-                minutes = float(coord[2:])
-            else:  # Longitude DDDMM.MMMM
-                degrees = float(coord[:3])
-                minutes = float(coord[3:])
+            degrees = int(coord[:deg_digits])
+            minutes = float(coord[deg_digits:])
                 
-            decimal = degrees + (minutes / 60.0)
+            decimal = degrees + minutes * _INV60
             
             # Apply direction
-            if direction in ['S', 'W']:
+            if direction == 'S' or direction == 'W':
                 decimal = -decimal
                 
             return decimal
@@ -1,17 +1,18 @@
 import time
 import threading
+from collections import deque
+from functools import lru_cache
 import serial
 from gps_parser import GPSReader
 from luma.core.interface.serial import i2c
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
-from PIL import ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from MA_init import MA_GPSReader
 
 
 # Init GPS
-ser = serial.Serial('/dev/serial0', 9600, timeout=0)
-gps = GPSReader(ser)
+ser = serial.Serial('/dev/serial0', 9600, timeout=0.1)  # bounds each worker read
+gps = GPSReader(ser, sentences={'RMC', 'GGA'})  # all this script shows
 
 MA_gps = MA_GPSReader(ser)
 
@@ -21,68 +22,114 @@ device = ssd1306(serial_i2c, width=128, height=64)
 
 font16 = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
 
-# Shared state between worker and UI
-lock = threading.Lock()
-shared = {
-    "has_fix": False,
-    "lat": 0.0,
-    "lon": 0.0,
-    "sats": 0,
-    "hdop": 0.0,
-    "time": "",
-    "date": "",
-}
+# Persistent OLED frame: the header is drawn once and each update only
+# clears and redraws the rows under it, instead of a fresh canvas per frame
+frame = Image.new("1", device.size)
+frame_draw = ImageDraw.Draw(frame)
+frame_draw.text(xy=(0, 0), text="GPS: FIX", font=font16, fill=255)
+frame_draw.line(xy=(0, 16, device.width - 1, 16), fill=255)
+
+@lru_cache(maxsize=128)
+def render_row(text: str) -> Image.Image:
+    """Render one 16 px text row; repeated strings come from the cache"""
+    # Usually only one of lat/lon changes per redraw, so the other row is
+    # a cache hit and costs a single paste instead of a FreeType render
+    row = Image.new("1", (device.width, 16))
+    ImageDraw.Draw(row).text(xy=(0, 0), text=text, font=font16, fill=255)
+    return row
+# render_row()
+
+# Print every GPS frame to stdout (debugging only; each frame is 3 writes)
+VERBOSE = False
+
+# Latest parsed GPSData, handed from worker to UI. Each frame is a fresh
+# object the parser never touches again, and single-slot deque append/pop
+# are atomic, so no lock is needed. Older unread frames are dropped.
+latest = deque(maxlen=1)
 
 stop_event = threading.Event()
+# Set by the worker only when the fix flag or the shown position changes,
+# so the UI sleeps through the repeats of a parked receiver
+changed = threading.Event()
 
 def gps_worker() -> None:
+    last_key = None
     while not stop_event.is_set():
-        d = gps.get_data()
-        with lock:
-            shared["has_fix"] = d.has_fix
-            shared["lat"] = d.latitude
-            shared["lon"] = d.longitude
-            shared["sats"] = d.satellites
-            shared["hdop"] = d.hdop
-            shared["time"] = d.time
-            shared["date"] = d.date
-        time.sleep(0.05)
+        # pyserial's readline() calls read(1) once per byte. A fixed-size
+        # read instead collects bytes (select + os.read inside pyserial)
+        # until 256 have arrived or the 0.1 s port timeout ends, so a burst
+        # comes back in a few big chunks even while the port sits idle.
+        data = ser.read(256)
+        if data and gps.feed(data):
+            d = gps.current_data
+            # Each chunk is parsed into a fresh GPSData, so one without an
+            # RMC reports 0,0. Drop it, so it neither wakes the UI nor
+            # replaces a real fix the UI has not picked up yet.
+            if d.latitude == 0 and d.longitude == 0:
+                continue
+            # Position quantized to the 4 decimals the OLED shows, so the UI
+            # can spot an unchanged screen with an int compare
+            lat_key = round(d.latitude * 1e4)
+            lon_key = round(d.longitude * 1e4)
+            latest.append((d, lat_key, lon_key))
+            key = (d.has_fix, lat_key, lon_key)
+            if key != last_key:
+                last_key = key
+                changed.set()
 
 threading.Thread(target=gps_worker, daemon=True).start()
 
-prev_lat_str = None
-prev_lon_str = None
+prev_lat_key = None
+prev_lon_key = None
 fix_latched = False
 
+# Redraws are capped at 10 Hz: after a wakeup the UI waits out the rest
+# of the current period, so a burst of changes collapses into one redraw
+UI_PERIOD_S = 0.1
+next_tick = time.monotonic()
+
 try:
     while True:
-        with lock:
-            has_fix = shared["has_fix"]
-            lat = shared["lat"]
-            lon = shared["lon"]
-            print(f"fix = {has_fix} sats = {shared['sats']}")
-            print(f"lat = {lat} lon = {lon} hdop = {shared['hdop']}")
-            print(f"time = {shared['time']} date = {shared['date']}")
+        # Clear before popping: a change that lands after the pop sets the
+        # event again, so no update is ever slept through
+        changed.wait(timeout=1.0)
+        changed.clear()
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_tick = time.monotonic() + UI_PERIOD_S
+
+        try:
+            d, lat_key, lon_key = latest.pop()
+        except IndexError:
+            continue
+        
+        has_fix = d.has_fix
+        lat = d.latitude
+        lon = d.longitude
+        if VERBOSE:
+            print(f"fix = {has_fix} sats = {d.satellites}\n"
+                  f"lat = {lat} lon = {lon} hdop = {d.hdop}\n"
+                  f"time = {d.time} date = {d.date}")
 
         if not fix_latched and has_fix:
             fix_latched = True
-            prev_lat_str = None
-            prev_lon_str = None
+            prev_lat_key = None
+            prev_lon_key = None
 
         if fix_latched:
-            lat_str = f"{lat:.4f}"
-            lon_str = f"{lon:.4f}"
-            if (lat != 0 and lat_str != prev_lat_str) or (lon != 0 and lon_str != prev_lon_str):
-                with canvas(device) as draw:
-                    draw.text(xy=(0, 0), text="GPS: FIX", font=font16, fill=255)
-                    draw.line(xy=(0, 16, device.width - 1, 16), fill=255)
-                    draw.text(xy=(0, 24), text=f"Lat: {lat_str}", font=font16, fill=255)
-                    draw.text(xy=(0, 48), text=f"Lon: {lon_str}", font=font16, fill=255)
-
-                prev_lat_str = lat_str
-                prev_lon_str = lon_str
-
-        time.sleep(0.1)
+            if (lat != 0 and lat_key != prev_lat_key) or (lon != 0 and lon_key != prev_lon_key):
+                # Only format the strings when the screen will actually change
+                lat_str = f"{lat:.4f}"
+                lon_str = f"{lon:.4f}"
+                # Each row image covers its full 16 px band, so pasting it
+                # also clears whatever was drawn there before
+                frame.paste(render_row(f"Lat: {lat_str}"), (0, 24))
+                frame.paste(render_row(f"Lon: {lon_str}"), (0, 48))
+                device.display(frame)
+
+                prev_lat_key = lat_key
+                prev_lon_key = lon_key
 except KeyboardInterrupt:
     stop_event.set()
 
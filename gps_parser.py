@@ -14,9 +14,15 @@ For use with UART GPS modules on Raspberry Pi 4B.
 # NOTE: SHOULDNT THE GPSDATA ALSO HAVE A HASNEWDATA MEMBER LIKE GPSREADER HAS SO THAT WE DONT HAVE TO CALL UPDATE EVERY TIME? IF SO, THEN SHOULDNT UPDATE BE PRIVATE?
 
 import time
+from typing import Dict, Iterable, List, Optional
 
 class GPSData:
     """Class to store GPS data with easy attribute access"""
+    # Fixed attribute set: no per-instance __dict__, and a new instance is
+    # built for every parsed chunk
+    __slots__ = ('has_fix', 'latitude', 'longitude', 'speed_knots', 'time', 'date',
+                 'satellites', 'altitude', 'hdop', 'pdop', 'vdop')
+    
     def __init__(self) -> None:
         self.has_fix = False
         self.latitude = 0.0
@@ -34,11 +40,21 @@ class GPSData:
 
 class GPSReader:
     """Class to handle GPS reading with non-blocking updates when getting data"""
-    def __init__(self, uart) -> None:
+    def __init__(self, uart, sentences: Optional[Iterable[str]] = None) -> None:
+        """
+        Args:
+            uart: Serial port / UART object to read NMEA data from
+            sentences: Sentence ids to parse, e.g. {'RMC', 'GGA'}. Others are
+                skipped without being split. Defaults to all supported ones
+        """
         self.uart = uart
-        self.message_buffer = ""
+        self._parsers = (None if sentences is None else
+                         {k: v for k, v in _PARSERS.items() if k in sentences})
+        self.message_buffer = bytearray()  # raw UART bytes, decoded per complete chunk
         self.last_data_time = time.monotonic()
         self.timeout_s = 0.5  # 500ms timeout between message parts
+        self.min_interval_s = 0.02  # update() calls closer together than this are no-ops
+        self._last_update_call = float('-inf')
         self.current_data = GPSData()
         self.has_new_data = False
     # __init__
@@ -76,9 +92,15 @@ class GPSReader:
     
     def update(self) -> bool:
         """Check for new GPS data and process it - non-blocking version"""
-        self.has_new_data = False
         current_time = time.monotonic()
         
+        # Several calls in the same tick share one poll of the UART; the
+        # extra calls have nothing new to report
+        if (current_time - self._last_update_call) < self.min_interval_s:
+            return False
+        self._last_update_call = current_time
+        self.has_new_data = False
+        
         # Check if timeout occurred with data in buffer
         if (current_time - self.last_data_time) > self.timeout_s and self.message_buffer:
             self._process_buffer()
@@ -90,13 +112,10 @@ class GPSReader:
             try:
                 # Read ONLY the currently available data - this is the key non-blocking change
                 raw = self.uart.read(bytes_available)
-                data = raw.decode('ascii', errors='ignore') if isinstance(raw, (bytes, bytearray)) else str(raw)
+                if isinstance(raw, str):
+                    raw = raw.encode('ascii', errors='ignore')
                 
-                # If buffer is empty or we recently received data, append to buffer
-                self.message_buffer += data
-                if '\n' in self.message_buffer:
-                    chunk, self.message_buffer = self.message_buffer.rsplit('\n', 1)
-                    self.current_data = _process_nmea_data(chunk)
+                if raw and self.feed(raw):
                     self.has_new_data = True
                 
                 # Update last data time
@@ -109,6 +128,28 @@ class GPSReader:
     
     
     
+    def feed(self, data: bytes) -> bool:
+        """
+        Add raw UART bytes and parse any complete sentences.
+        For callers that do their own (blocking) reads, e.g. ser.readline().
+        
+        Returns:
+            bool: True if a complete chunk was parsed into current_data
+        """
+        # Append the raw bytes; nothing is decoded until a line is complete
+        self.message_buffer += data
+        idx = self.message_buffer.rfind(b'\n')
+        if idx < 0:
+            return False
+        
+        chunk = bytes(self.message_buffer[:idx])
+        del self.message_buffer[:idx + 1]
+        self.current_data = _process_nmea_data(chunk.decode('ascii', errors='ignore'), self._parsers)
+        return True
+    # feed
+    
+    
+    
     def get_data(self) -> GPSData:
         """
         Get the current GPS data.
@@ -128,60 +169,55 @@ class GPSReader:
         if not self.message_buffer:
             return
         
-        self.current_data = _process_nmea_data(self.message_buffer)
-        self.message_buffer = ""
+        self.current_data = _process_nmea_data(self.message_buffer.decode('ascii', errors='ignore'),
+                                               self._parsers)
+        self.message_buffer.clear()
         return None
     # _process_buffer
     
     
     
-    # Convenience properties for direct access to GPS data
+    # Convenience properties for direct access to GPS data.
+    # These only read the last parsed data; call update() (or get_data())
+    # once per tick to poll the UART.
     @property
     def latitude(self) -> float:
         """Get the current latitude"""
-        self.update()
         return self.current_data.latitude
     
     @property
     def longitude(self) -> float:
         """Get the current longitude"""
-        self.update()
         return self.current_data.longitude
     
     @property
     def altitude(self) -> float:
         """Get the current altitude"""
-        self.update()
         return self.current_data.altitude
     
     @property
     def has_fix(self) -> bool:
         """Get the current fix status"""
-        self.update()
         return self.current_data.has_fix
     
     @property
     def satellites(self) -> int:
         """Get the current number of satellites"""
-        self.update()
         return self.current_data.satellites
     
     @property
     def speed(self) -> float:
         """Get the current speed in mph"""
-        self.update()
         return (self.current_data.speed_knots * 1.15078)
     
     @property
     def time(self) -> str:
         """Get the current GPS time"""
-        self.update()
         return self.current_data.time
     
     @property
     def date(self) -> str:
         """Get the current GPS date"""
-        self.update()
         return self.current_data.date
 
 
@@ -194,8 +230,11 @@ def parse_gps_data(nmea_chunk) -> GPSData:
 
 
 
-def _process_nmea_data(nmea_data: str) -> GPSData:
-    """Process a complete NMEA data string"""
+def _process_nmea_data(nmea_data: str, parsers: Optional[Dict] = None) -> GPSData:
+    """Process a complete NMEA data string (parsers defaults to _PARSERS)"""
+    if parsers is None:
+        parsers = _PARSERS
+    
     # Initialize data class
     gps_data = GPSData()
     
@@ -207,27 +246,20 @@ def _process_nmea_data(nmea_data: str) -> GPSData:
         if not sentence:
             continue
             
-        # Add the $ back for proper format
-        sentence = '$' + sentence.strip()
-        msg = sentence[3:6] if (len(sentence) >= 6 and sentence[0] == '$') else ""
-        
-        if msg == 'RMC':
-            _parse_rmc(sentence, gps_data)
-        elif msg == 'GGA':
-            _parse_gga(sentence, gps_data)
-        elif msg == 'GSA':
-            _parse_gsa(sentence, gps_data)
+        # Sentence id without the '$' and talker, so $GP/$GN variants share
+        # a parser. Split each sentence once, and only if it gets parsed.
+        sentence = sentence.strip()
+        parser = parsers.get(sentence[2:5])
+        if parser is not None:
+            parser(sentence.split(','), gps_data)
     
     return gps_data
 # _process_nmea_data
 
 
 
-def _parse_rmc(sentence: str, gps_data: GPSData) -> None:
-    """Parse RMC sentence for time, date, location, and speed"""
-    
-    # Split the sentence into parts
-    parts = sentence.split(',')
+def _parse_rmc(parts: List[str], gps_data: GPSData) -> None:
+    """Parse RMC sentence for time, date, location, and speed (parts = comma-split fields)"""
     
     if len(parts) < 12:
         return
@@ -266,25 +298,11 @@ def _parse_rmc(sentence: str, gps_data: GPSData) -> None:
         # Extract latitude and longitude with sign based on direction
         if parts[3] and parts[5]:
             try:
-                # Latitude
-                lat_deg = float(parts[3][0:2])
-                lat_min = float(parts[3][2:])
-                lat_decimal = lat_deg + (lat_min / 60)
-                
-                # Apply sign based on direction (N is positive, S is negative)
-                if parts[4] == 'S':
-                    lat_decimal = -lat_decimal
-                gps_data.latitude = lat_decimal
-                
-                # Longitude
-                lon_deg = float(parts[5][0:3])
-                lon_min = float(parts[5][3:])
-                lon_decimal = lon_deg + (lon_min / 60)
+                # Latitude (N is positive, S is negative)
+                gps_data.latitude = _parse_coordinate(parts[3], parts[4] == 'S')
                 
-                # Apply sign based on direction (E is positive, W is negative)
-                if parts[6] == 'W':
-                    lon_decimal = -lon_decimal
-                gps_data.longitude = lon_decimal
+                # Longitude (E is positive, W is negative)
+                gps_data.longitude = _parse_coordinate(parts[5], parts[6] == 'W')
             except (ValueError, IndexError):
                 # If parsing fails, don't update coordinates
                 pass
@@ -300,10 +318,20 @@ def _parse_rmc(sentence: str, gps_data: GPSData) -> None:
 
 
 
-def _parse_gga(sentence: str, gps_data: GPSData) -> None:
-    """Parse GGA sentence for satellites, altitude, and HDOP"""
-    
-    parts = sentence.split(',')
+def _parse_coordinate(value: str, negative: bool) -> float:
+    """Convert an NMEA DDMM.MMMM / DDDMM.MMMM field to decimal degrees"""
+    # One float() for the whole field; the degrees are everything above
+    # the two minute digits, so no slicing is needed for either width
+    coord = float(value)
+    degrees = coord // 100
+    decimal = degrees + (coord - degrees * 100) / 60
+    return -decimal if negative else decimal
+# _parse_coordinate
+
+
+
+def _parse_gga(parts: List[str], gps_data: GPSData) -> None:
+    """Parse GGA sentence for satellites, altitude, and HDOP (parts = comma-split fields)"""
     
     if len(parts) < 15:
         return
@@ -333,10 +361,8 @@ def _parse_gga(sentence: str, gps_data: GPSData) -> None:
 
 
 
-def _parse_gsa(sentence: str, gps_data: GPSData) -> None:
-    """Parse GSA sentence for PDOP, HDOP, and VDOP"""
-    
-    parts = sentence.split(',')
+def _parse_gsa(parts: List[str], gps_data: GPSData) -> None:
+    """Parse GSA sentence for PDOP, HDOP, and VDOP (parts = comma-split fields)"""
     
     if len(parts) < 18:
         return
@@ -366,6 +392,15 @@ def _parse_gsa(sentence: str, gps_data: GPSData) -> None:
 
 
 
+# Sentence id (characters 3-6, e.g. 'RMC') -> parser
+_PARSERS = {
+    'RMC': _parse_rmc,
+    'GGA': _parse_gga,
+    'GSA': _parse_gsa,
+}
+
+
+
 
 
 
@@ -5,14 +5,14 @@ which is ran on its on-board RPi 5 companion computer.
 It also displays the GPS coordinates on the OLED screen.
 """
 import time
-import threading
+import socket
+from collections import deque
 import serial
 from gps_parser import GPSReader
-from luma.core.interface.serial import i2c
+from luma.core.interface.serial import i2c, spi
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
-from PIL import ImageFont
-import paho.mqtt.publish as publish
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+import paho.mqtt.client as mqtt
 
 
 
@@ -27,92 +27,246 @@ TODO:
 # This is the RPi5's (drone's) IP address when on Solis
 BROKER_IP = "192.168.43.102"
 TOPIC = "vertiport/gps"
+CLIENT_ID = "vertiport-gps"
+
+# Optional batching: when > 0, fixes are collected and sent together this
+# often as "lat,lon,unix_time" lines on BATCH_TOPIC, with the newest fix
+# also sent on TOPIC. At 0 every new fix is published on TOPIC right away.
+BATCH_INTERVAL_S = 0.0
+BATCH_TOPIC = TOPIC + "/batch"
+
+# The OLED is redrawn at most this often, independent of the publish rate:
+# nobody reads 4-decimal coordinates faster than that, and each redraw
+# ties up the I2C bus
+REDRAW_INTERVAL_S = 0.5
+
+# OLED wiring: "i2c" (bus 1, 0x3C) or "spi" (SPI0 CE0, DC on GPIO 24,
+# RST on GPIO 25)
+OLED_BUS = "i2c"
+
+# Print every GPS chunk and publish to stdout (debugging only)
+VERBOSE = False
 
 # Init GPS
 ser = serial.Serial(port='/dev/serial0', baudrate=9600, timeout=0)
 gps = GPSReader(uart=ser)
 
-# Init OLED and its font.
-serial_i2c = i2c(port=1, address=0x3C)
-device = ssd1306(serial_interface=serial_i2c, width=128, height=64)
+# Init MQTT: one persistent session instead of a connect/disconnect per message.
+# connect_async() + loop_start() never block on the broker; paho's network
+# thread connects in the background and reconnects on its own if Wi-Fi drops.
+try:
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=CLIENT_ID, clean_session=True)
+except AttributeError:  # paho-mqtt < 2.0
+    client = mqtt.Client(client_id=CLIENT_ID, clean_session=True)
+client.reconnect_delay_set(min_delay=1, max_delay=30)
+
+def on_socket_open(client, userdata, sock) -> None:
+    # Fixes are tiny packets sent one at a time; without TCP_NODELAY, Nagle +
+    # delayed ACK on the broker side holds each one back by up to ~40 ms.
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (AttributeError, OSError):
+        pass  # not a plain TCP socket (e.g. websockets)
+    return None
+# on_socket_open()
+
+client.on_socket_open = on_socket_open
+client.connect_async(BROKER_IP, 1883, keepalive=60)
+client.loop_start()
+
+# Init OLED and its font. SPI-wired SSD1306 modules take a full frame in
+# well under 1 ms vs ~20 ms over 400 kHz I2C; the current board is I2C.
+if OLED_BUS == "spi":
+    oled_serial = spi(port=0, device=0, gpio_DC=24, gpio_RST=25)
+else:
+    oled_serial = i2c(port=1, address=0x3C)
+device = ssd1306(serial_interface=oled_serial, width=128, height=64)
 font16 = ImageFont.truetype(
     font="/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 
     size=16
 )
 
-# Shared state between worker and UI
-# NOTE: Add more attributes here if you want to access/print them.
-lock = threading.Lock()
-shared = {
-    "has_fix": False,
-    "lat": 0.0,
-    "lon": 0.0,
-    "sats": 0,
-}
-
-stop_event = threading.Event()
-
-def gps_worker() -> None:
-    while not stop_event.is_set():
-        d = gps.get_data()
-        with lock:
-            shared["has_fix"] = d.has_fix
-            shared["lat"] = d.latitude
-            shared["lon"] = d.longitude
-            shared["sats"] = d.satellites
-        time.sleep(0.05)
+# Persistent OLED frame. The static header is drawn once; after the first
+# full frame only the two page bands holding the Lat/Lon text are re-sent.
+frame = Image.new("1", device.size)
+frame_draw = ImageDraw.Draw(frame)
+frame_draw.text(xy=(0, 0), text="GPS: FIX", font=font16, fill=255)
+frame_draw.line(xy=(0, 16, device.width - 1, 16), fill=255)
+# Page-aligned text rows. DejaVuSans-Bold 16 ink ends at y=15, so each row
+# fits in two 8-px pages: Lat in pages 3-4, Lon in pages 6-7 (5 stays blank)
+LAT_Y = 24
+LON_Y = 48
+ROW_H = 16
+
+# Pre-rendered glyphs for everything a coordinate value can contain. The
+# labels are drawn into the frame once; on each update only the value area
+# is cleared and the cached glyphs are pasted in, which skips FreeType.
+GLYPHS = {}
+for c in "0123456789.-°":
+    glyph = Image.new("1", font16.getbbox(c)[2:])
+    ImageDraw.Draw(glyph).text(xy=(0, 0), text=c, font=font16, fill=255)
+    GLYPHS[c] = (glyph, font16.getlength(c))
+
+def value_x(label: str) -> int:
+    """Pen x where a value drawn right after label starts (kerning included)"""
+    # getlength() ignores kerning but text() applies it ("at" in "Lat: "),
+    # so find where a glyph following the label really lands.
+    size = (device.width, 20)
+    alone = Image.new("1", size)
+    ImageDraw.Draw(alone).text(xy=(0, 0), text=label, font=font16, fill=255)
+    joined = Image.new("1", size)
+    ImageDraw.Draw(joined).text(xy=(0, 0), text=label + "8", font=font16, fill=255)
+    glyph_left = ImageChops.logical_xor(joined, alone).getbbox()[0]
+    return glyph_left - GLYPHS["8"][0].getbbox()[0]
+# value_x()
+
+def blit_text(x: float, y: int, text: str) -> None:
+    """Paste cached glyphs for text into the frame starting at pen (x, y)"""
+    for c in text:
+        glyph, advance = GLYPHS[c]
+        frame.paste(255, (round(x), y), glyph)
+        x += advance
     return None
-# gps_worker()
-
-
-
-print("Starting GPS worker")
-threading.Thread(target=gps_worker, daemon=True).start()
+# blit_text()
+
+frame_draw.text(xy=(0, LAT_Y), text="Lat: ", font=font16, fill=255)
+frame_draw.text(xy=(0, LON_Y), text="Lon: ", font=font16, fill=255)
+LAT_X = value_x("Lat: ")
+LON_X = value_x("Lon: ")
+
+def push_rows(top: int, bottom: int) -> None:
+    """Send frame rows [top, bottom) to the OLED; both must be multiples of 8"""
+    # SSD1306 memory is page-major: one byte per column per 8-row page, LSB
+    # at the top. Transposing makes each column one packed row of pages bytes.
+    pages = (bottom - top) // 8
+    band = frame.crop((0, top, device.width, bottom))
+    packed = band.transpose(Image.Transpose.TRANSPOSE).tobytes("raw", "1;R")
+    buf = bytearray(len(packed))
+    for p in range(pages):
+        buf[p * device.width:(p + 1) * device.width] = packed[p::pages]
+
+    # Column/page address window, then the band's bytes
+    device.command(0x21, 0, device.width - 1, 0x22, top // 8, bottom // 8 - 1)
+    device.data(list(buf))
+    return None
+# push_rows()
+
+batch = deque(maxlen=16)
+next_flush = 0.0
+prev_message = None
+prev_lat = None
+prev_lon = None
+header_shown = False
 prev_lat_str = None
 prev_lon_str = None
+pending_text = None
+next_redraw = 0.0
 fix_latched = False
 
 print("Starting UI")
 try:
     while True:
-        print("Getting the GPS data...")
-        with lock:
-            has_fix = shared["has_fix"]
-            lat = shared["lat"]
-            lon = shared["lon"]
-            # If this never shows fix=True, your worker isn’t getting complete 
+        if batch and time.monotonic() >= next_flush:
+            # One PUBLISH for the whole batch, plus the newest fix for
+            # subscribers that only want the current position
+            client.publish(BATCH_TOPIC, payload="\n".join(batch), qos=0, retain=False)
+            client.publish(TOPIC, payload=prev_message, qos=0, retain=False)
+            batch.clear()
+            next_flush = time.monotonic() + BATCH_INTERVAL_S
+
+        if pending_text and time.monotonic() >= next_redraw:
+            # Display on OLED: redraw only the coordinate rows, with the
+            # newest queued text (intermediate fixes are never drawn)
+            lat_str, lon_str = pending_text
+            frame_draw.rectangle((LAT_X, LAT_Y, device.width - 1, LON_Y - 1), fill=0)
+            frame_draw.rectangle((LON_X, LON_Y, device.width - 1, device.height - 1), fill=0)
+            blit_text(LAT_X, LAT_Y, lat_str)
+            blit_text(LON_X, LON_Y, lon_str)
+            if header_shown:
+                push_rows(LAT_Y, LAT_Y + ROW_H)
+                push_rows(LON_Y, LON_Y + ROW_H)
+            else:
+                device.display(frame)
+                header_shown = True
+            pending_text = None
+            next_redraw = time.monotonic() + REDRAW_INTERVAL_S
+
+        # Single loop, no worker thread: feed whatever bytes the UART has
+        # and only act when that completed a chunk of sentences
+        n = ser.in_waiting
+        if not n:
+            time.sleep(0.01)
+            continue
+        if not gps.feed(ser.read(n)):
+            continue
+
+        d = gps.current_data
+        has_fix = d.has_fix
+        lat = d.latitude
+        lon = d.longitude
+        if VERBOSE:
+            # If this never shows fix=True, the parser isn’t getting complete 
             # NMEA sentences (likely because another reader is consuming the stream).
-            print(f"fix = {has_fix} sats = {shared['sats']}")
-            print(f"lat = {lat} lon = {lon}")
+            print(f"Getting the GPS data...\n"
+                  f"fix = {has_fix} sats = {d.satellites}\n"
+                  f"lat = {lat} lon = {lon}")
 
         if not fix_latched and has_fix:
             fix_latched = True
+            prev_message = None
+            prev_lat = None
+            prev_lon = None
             prev_lat_str = None
             prev_lon_str = None
 
         if fix_latched:
-            # NOTE: IS THE DEGREE SIGN APPROPRIATE HERE?
-            lat_str = f"{lat:.4f}°"
-            lon_str = f"{lon:.4f}°"
+            # Each chunk is parsed into a fresh GPSData, so one without an
+            # RMC (GGA/GSA only) reports 0,0. Skip it first, so it never
+            # replaces the last real fix in the comparisons below.
+            if lat == 0 and lon == 0:
+                continue
+
+            # Same floats as last time: nothing to format, publish or redraw
+            if lat == prev_lat and lon == prev_lon:
+                continue
+            prev_lat = lat
+            prev_lon = lon
+
+            # Dedupe on the exact payload: anything that would publish the
+            # same bytes again is skipped, publish and redraw alike
             message = f"{lat:.8f},{lon:.8f}"
-            if (lat != 0 and lat_str != prev_lat_str) or (lon != 0 and lon_str != prev_lon_str):
-                with canvas(device) as draw:
-                    # Publish to the drone
+            if message == prev_message:
+                continue
+            prev_message = message
+
+            # Publish to the drone
+            if BATCH_INTERVAL_S > 0:
+                batch.append(f"{message},{time.time():.3f}")
+            else:
+                if VERBOSE:
                     print(f"Sending: {message}")
-                    publish.single(topic=TOPIC, payload=message, hostname=BROKER_IP)
-                    
-                    # Display on OLED
-                    draw.text(xy=(0, 0), text="GPS: FIX", font=font16, fill=255)
-                    draw.line(xy=(0, 16, device.width - 1, 16), fill=255)
-                    draw.text(xy=(0, 24), text=f"Lat: {lat_str}", font=font16, fill=255)
-                    draw.text(xy=(0, 48), text=f"Lon: {lon_str}", font=font16, fill=255)
+                # QoS 0 on purpose: the next fix supersedes a lost one, so a
+                # PUBACK round-trip per update buys nothing. If a late
+                # subscriber needs the last fix, use retain=True, not QoS.
+                # publish() only queues the packet for paho's network thread
+                # and returns; it is never waited on, so broker backpressure
+                # or a Wi-Fi drop cannot hold up the OLED redraw below.
+                info = client.publish(TOPIC, payload=message, qos=0, retain=False)
+                if VERBOSE and info.rc != mqtt.MQTT_ERR_SUCCESS:
+                    print(f"Publish not sent (rc = {info.rc}): {mqtt.error_string(info.rc)}")
 
+            # NOTE: IS THE DEGREE SIGN APPROPRIATE HERE?
+            lat_str = f"{lat:.4f}°"
+            lon_str = f"{lon:.4f}°"
+            # The OLED shows 4 decimals, so only queue a redraw when those
+            # change; the top of the loop draws it when the timer allows
+            if lat_str != prev_lat_str or lon_str != prev_lon_str:
+                pending_text = (lat_str, lon_str)
                 prev_lat_str = lat_str
                 prev_lon_str = lon_str
-
-        time.sleep(0.1)
 except KeyboardInterrupt:
-    stop_event.set()
+    client.disconnect()
+    client.loop_stop()
 
 
 
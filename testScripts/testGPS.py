@@ -7,13 +7,19 @@ import time
 
 
 # Establish serial connection to GPS
-ser = serial.Serial('/dev/serial0', 9600, timeout=1)
+ser = serial.Serial('/dev/serial0', 9600, timeout=0.1)  # bounds each read
 
-# Using the serial port
+# Using the serial port: the receiver sends sentences in bursts, so read
+# fixed-size chunks (256 bytes or whatever arrived within the 0.1 s
+# timeout) and split complete lines out of a persistent buffer.
+buf = bytearray()
 while True:
-    line = ser.readline().decode('ascii', errors='replace').strip()
-    if line:
-        print(line)
+    buf += ser.read(256)
+    while (i := buf.find(b'\n')) >= 0:
+        line = bytes(buf[:i]).strip()
+        del buf[:i + 1]
+        if line:
+            print(line.decode('ascii', errors='replace'))
 
 
 